@@ -1,10 +1,20 @@
 """Global test fixtures for RT Tools."""
 
+from functools import cache
 from pathlib import Path
 
 import pytest
 from pytest import fixture
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+FIXTURE_DATA_PATH = FIXTURES_DIR / "rt_ticket_data"
+
+
+@cache
+def load_fixture_bytes(path: Path) -> bytes:
+    """Read a fixture file once per process, shared across test modules."""
+    return path.read_bytes()
+
 
 def pytest_addoption(parser):
     """Add custom pytest command line options."""
@@ -14,35 +24,45 @@ def pytest_addoption(parser):
         default=False,
         help="run end-to-end tests",
     )
+    parser.addoption(
+        "--check-fixtures",
+        action="store_true",
+        default=False,
+        help="run fixture integrity checks",
+    )
 
 
 def pytest_configure(config):
     """Register custom markers."""
     config.addinivalue_line("markers", "e2e: mark test as end-to-end test")
+    config.addinivalue_line(
+        "markers", "fixtures_integrity: verify fixture files on disk"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
-    """Skip end-to-end tests unless --e2e option is used."""
-    if config.getoption("--e2e"):
-        # When --e2e is used, run all tests including end-to-end tests
-        return
+    """Skip opt-in tests unless their command line option is used.
+
+    End-to-end tests need --e2e; fixture integrity checks need --check-fixtures.
+    """
+    skips = {}
+    if not config.getoption("--e2e"):
+        skips["e2e"] = pytest.mark.skip(reason="need --e2e option to run")
+    if not config.getoption("--check-fixtures"):
+        skips["fixtures_integrity"] = pytest.mark.skip(
+            reason="need --check-fixtures option to run"
+        )
 
-    skip_e2e = pytest.mark.skip(reason="need --e2e option to run")
     for item in items:
-        if "e2e" in item.keywords:
-            item.add_marker(skip_e2e)
+        for keyword, skip in skips.items():
+            if keyword in item.keywords:
+                item.add_marker(skip)
 
 
 @fixture(scope="session")
 def fixtures_dir() -> Path:
     """Return path to the test fixtures directory."""
-    return Path(__file__).parent / "fixtures"
-
-
-@fixture(scope="session")
-def fixture_data_path(fixtures_dir) -> Path:
-    """Return path to test fixture data."""
-    return fixtures_dir / "rt_ticket_data"
+    return FIXTURES_DIR
 
 
 @fixture(scope="session")
@@ -52,9 +72,9 @@ def rt37525_sanitized_data(fixtures_dir):
 
     # Load all fixture files
     data = {}
-    data["metadata"] = (fixture_path / "metadata.txt").read_bytes()
-    data["history"] = (fixture_path / "history.txt").read_bytes()
-    data["attachments"] = (fixture_path / "attachments.txt").read_bytes()
+    data["metadata"] = load_fixture_bytes(fixture_path / "metadata.txt")
+    data["history"] = load_fixture_bytes(fixture_path / "history.txt")
+    data["attachments"] = load_fixture_bytes(fixture_path / "attachments.txt")
 
     # Load individual history messages
     data["history_messages"] = {}
@@ -63,7 +83,7 @@ def rt37525_sanitized_data(fixtures_dir):
             history_id = history_dir.name
             message_file = history_dir / "message.txt"
             if message_file.exists():
-                data["history_messages"][history_id] = message_file.read_bytes()
+                data["history_messages"][history_id] = load_fixture_bytes(message_file)
 
     # Load attachment content (simulate what would be downloaded)
     data["attachment_content"] = {}
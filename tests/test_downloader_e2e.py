@@ -9,7 +9,6 @@ due to the fixtures being sanitized versions of the original.
 """
 
 import subprocess
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -160,26 +159,23 @@ def test_downloader_outgoing_email_filtering(ticket_37525):
 
 
 @pytest.mark.e2e
-def test_downloader_error_handling_invalid_ticket():
+def test_downloader_error_handling_invalid_ticket(tmp_path):
     """Test downloader error handling with invalid ticket ID."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        parent_dir = Path(temp_dir) / "test_invalid"
+    parent_dir = tmp_path / "test_invalid"
 
-        session = RTSession()
-        session.authenticate()
-        downloader = TicketDownloader(session)
+    session = RTSession()
+    session.authenticate()
+    downloader = TicketDownloader(session)
 
-        # Should handle invalid ticket gracefully (not crash)
-        downloader.download_ticket("999999", parent_dir)
+    # Should handle invalid ticket gracefully (not crash)
+    downloader.download_ticket("999999", parent_dir)
 
-        # Should still create ticket directory
-        ticket_dir = parent_dir / "rt999999"
-        assert ticket_dir.exists(), (
-            "Should create ticket directory even for invalid ticket"
-        )
+    # Should still create ticket directory
+    ticket_dir = parent_dir / "rt999999"
+    assert ticket_dir.exists(), "Should create ticket directory even for invalid ticket"
 
-        # May or may not create files depending on RT server response
-        # The important thing is that it doesn't crash
+    # May or may not create files depending on RT server response
+    # The important thing is that it doesn't crash
 
 
 @pytest.mark.e2e
@@ -238,39 +234,36 @@ def test_downloader_content_validation(ticket_37525):
 
 
 @pytest.mark.e2e
-def test_command_line_directory_structure():
+def test_command_line_directory_structure(tmp_path):
     """Test that command line creates correct directory structure using subprocess."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        parent_dir = Path(temp_dir) / "cli_test"
-
-        # Run the download-ticket command using subprocess
-        result = subprocess.run(
-            ["download-ticket", "37525", "--output-dir", str(parent_dir)],
-            capture_output=True,
-            text=True,
-            timeout=300,  # 5 minute timeout
-        )
-
-        # Command should succeed
-        assert result.returncode == 0, f"Command failed: {result.stderr}"
-
-        # Verify the expected directory structure was created
-        ticket_dir = parent_dir / "rt37525"
-        assert ticket_dir.exists(), "Should create rt37525 directory"
-        assert ticket_dir.is_dir(), "rt37525 should be a directory"
-
-        # Verify basic files are present
-        assert (ticket_dir / "metadata.txt").exists(), "Should create metadata.txt"
-        assert (ticket_dir / "history.txt").exists(), "Should create history.txt"
-        assert (ticket_dir / "attachments.txt").exists(), (
-            "Should create attachments.txt"
-        )
-
-        # Verify at least some history directories exist
-        history_dirs = [d for d in ticket_dir.iterdir() if d.is_dir()]
-        assert len(history_dirs) > 0, "Should create history directories"
-
-        # Verify each history directory has message.txt
-        for history_dir in history_dirs:
-            message_file = history_dir / "message.txt"
-            assert message_file.exists(), f"Missing message.txt in {history_dir.name}"
+    parent_dir = tmp_path / "cli_test"
+
+    # Run the download-ticket command using subprocess
+    result = subprocess.run(
+        ["download-ticket", "37525", "--output-dir", str(parent_dir)],
+        capture_output=True,
+        text=True,
+        timeout=300,  # 5 minute timeout
+    )
+
+    # Command should succeed
+    assert result.returncode == 0, f"Command failed: {result.stderr}"
+
+    # Verify the expected directory structure was created
+    ticket_dir = parent_dir / "rt37525"
+    assert ticket_dir.exists(), "Should create rt37525 directory"
+    assert ticket_dir.is_dir(), "rt37525 should be a directory"
+
+    # Verify basic files are present
+    assert (ticket_dir / "metadata.txt").exists(), "Should create metadata.txt"
+    assert (ticket_dir / "history.txt").exists(), "Should create history.txt"
+    assert (ticket_dir / "attachments.txt").exists(), "Should create attachments.txt"
+
+    # Verify at least some history directories exist
+    history_dirs = [d for d in ticket_dir.iterdir() if d.is_dir()]
+    assert len(history_dirs) > 0, "Should create history directories"
+
+    # Verify each history directory has message.txt
+    for history_dir in history_dirs:
+        message_file = history_dir / "message.txt"
+        assert message_file.exists(), f"Missing message.txt in {history_dir.name}"
@@ -1,12 +1,27 @@
 """End-to-end tests for dump-ticket command with real server connections."""
 
+import shutil
 import subprocess
 
 import pytest
 
 
+@pytest.fixture(scope="module")
+def dump_ticket_output_root(tmp_path_factory):
+    """Return an output directory shared by all dump-ticket tests."""
+    return tmp_path_factory.mktemp("dump_ticket_out")
+
+
+@pytest.fixture
+def output_dir(dump_ticket_output_root, request):
+    """Return a per-test directory under the shared root, removed afterwards."""
+    path = dump_ticket_output_root / request.node.name
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
 @pytest.mark.e2e
-def test_dump_ticket_file_output(tmp_path):
+def test_dump_ticket_file_output(output_dir):
     """Integration test for dump-ticket command with -o option.
 
     Tests the complete flow:
@@ -18,7 +33,7 @@ def test_dump_ticket_file_output(tmp_path):
     Requires actual RT server access and valid ticket/attachment.
     """
     # Define output file path (directories will be created automatically)
-    output_file = tmp_path / "37525" / "attachments" / "1483996.bin"
+    output_file = output_dir / "37525" / "attachments" / "1483996.bin"
 
     # Command to test
     cmd = [
@@ -65,9 +80,9 @@ def test_dump_ticket_file_output(tmp_path):
 
 
 @pytest.mark.e2e
-def test_dump_ticket_invalid_attachment(tmp_path):
+def test_dump_ticket_invalid_attachment(output_dir):
     """Test dump-ticket with invalid attachment ID."""
-    output_file = tmp_path / "invalid_attachment.bin"
+    output_file = output_dir / "invalid_attachment.bin"
 
     cmd = [
         "dump-ticket",
@@ -88,10 +103,10 @@ def test_dump_ticket_invalid_attachment(tmp_path):
 
 
 @pytest.mark.e2e
-def test_dump_ticket_output_directory_creation(tmp_path):
+def test_dump_ticket_output_directory_creation(output_dir):
     """Test that dump-ticket automatically creates parent directories."""
     # Use a deeply nested path that doesn't exist
-    output_file = tmp_path / "deep" / "nested" / "path" / "attachment.bin"
+    output_file = output_dir / "deep" / "nested" / "path" / "attachment.bin"
 
     cmd = [
         "dump-ticket",
@@ -118,7 +133,9 @@ def test_dump_ticket_output_directory_creation(tmp_path):
 
     # Verify the nested directories were created
     assert output_file.parent.exists(), "Parent directories should be created"
-    assert (tmp_path / "deep" / "nested" / "path").exists(), "Nested path should exist"
+    assert (output_dir / "deep" / "nested" / "path").exists(), (
+        "Nested path should exist"
+    )
 
     # File should have content
     assert output_file.stat().st_size > 0, "Output file should contain attachment data"
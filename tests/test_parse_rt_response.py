@@ -1,168 +1,122 @@
 """Unit tests for parse_rt_response function."""
 
-from unittest.mock import Mock
+from types import SimpleNamespace
 
-from pytest import mark, raises
+from pytest import mark, param, raises
 
 from rt_tools import RTResponseData, RTResponseError, parse_rt_response
 
+TICKET_URL = "https://rt.example.com/REST/1.0/ticket/123"
+CONTENT_URL = "https://rt.example.com/REST/1.0/ticket/123/attachments/456/content"
 
-def create_mock_response(
-    content: bytes, url: str = "https://rt.example.com/REST/1.0/ticket/123"
-) -> Mock:
+
+def create_mock_response(content: bytes, url: str = TICKET_URL) -> SimpleNamespace:
     """Create a mock response with content and URL."""
-    response = Mock()
-    response.content = content
-    response.url = url
-    return response
+    return SimpleNamespace(content=content, url=url)
 
 
-def test_valid_200_ok_response():
-    """Test parsing a valid 200 Ok RT response (non-content URL)."""
-    response = create_mock_response(
+VALID_CASES = [
+    # Valid 200 Ok RT response (non-content URL)
+    param(
         b"RT/4.4.3 200 Ok\n\nTicket data here",
-        "https://rt.example.com/REST/1.0/ticket/123",
-    )
-
-    result = parse_rt_response(response)
-
-    assert isinstance(result, RTResponseData)
-    assert result.version == "4.4.3"
-    assert result.status_code == 200
-    assert result.status_text == "Ok"
-    assert result.is_ok is True
-    assert result.payload == b"Ticket data here"
-
-
-def test_valid_404_response():
-    """Test parsing a valid 404 Not Found RT response."""
-    response = create_mock_response(b"RT/5.0.1 404 Not Found\n\nTicket not found")
-
-    result = parse_rt_response(response)
-
-    assert result.version == "5.0.1"
-    assert result.status_code == 404
-    assert result.status_text == "Not Found"
-    assert result.is_ok is False
-    assert result.payload == b"Ticket not found"
-
-
-def test_valid_500_response():
-    """Test parsing a valid 500 Internal Server Error RT response."""
-    response = create_mock_response(
-        b"RT/3.8.10 500 Internal Server Error\n\nServer error details"
-    )
-
-    result = parse_rt_response(response)
-
-    assert result.version == "3.8.10"
-    assert result.status_code == 500
-    assert result.status_text == "Internal Server Error"
-    assert result.is_ok is False
-    assert result.payload == b"Server error details"
-
-
-def test_response_without_trailing_suffix():
-    """Test parsing RT response without the 3-newline suffix (non-content URL)."""
-    response = create_mock_response(b"RT/4.4.3 200 Ok\n\nTicket data without suffix")
-
-    result = parse_rt_response(response)
-
-    assert result.version == "4.4.3"
-    assert result.status_code == 200
-    assert result.status_text == "Ok"
-    assert result.is_ok is True
-    assert result.payload == b"Ticket data without suffix"
-
-
-def test_content_url_with_trailing_suffix():
-    """Test parsing RT response from /content URL with 3-newline suffix."""
-    response = create_mock_response(
+        TICKET_URL,
+        ("4.4.3", 200, "Ok", True, b"Ticket data here"),
+        id="200_ok",
+    ),
+    param(
+        b"RT/5.0.1 404 Not Found\n\nTicket not found",
+        TICKET_URL,
+        ("5.0.1", 404, "Not Found", False, b"Ticket not found"),
+        id="404_not_found",
+    ),
+    param(
+        b"RT/3.8.10 500 Internal Server Error\n\nServer error details",
+        TICKET_URL,
+        ("3.8.10", 500, "Internal Server Error", False, b"Server error details"),
+        id="500_server_error",
+    ),
+    # Non-content URL responses have no 3-newline suffix
+    param(
+        b"RT/4.4.3 200 Ok\n\nTicket data without suffix",
+        TICKET_URL,
+        ("4.4.3", 200, "Ok", True, b"Ticket data without suffix"),
+        id="no_trailing_suffix",
+    ),
+    # /content URL responses have the 3-newline suffix stripped
+    param(
         b"RT/4.4.3 200 Ok\n\nAttachment content\n\n\n",
-        "https://rt.example.com/REST/1.0/ticket/123/attachments/456/content",
-    )
-
-    result = parse_rt_response(response)
-
-    assert result.version == "4.4.3"
-    assert result.status_code == 200
-    assert result.status_text == "Ok"
-    assert result.is_ok is True
-    assert result.payload == b"Attachment content"
-
-
-def test_response_200_with_different_status_text():
-    """Test that is_ok is False for 200 status with non-'Ok' text."""
-    response = create_mock_response(b"RT/4.4.3 200 Success\n\nTicket data")
-
-    result = parse_rt_response(response)
-
-    assert result.version == "4.4.3"
-    assert result.status_code == 200
-    assert result.status_text == "Success"
-    assert result.is_ok is False  # Only "Ok" makes is_ok True
-    assert result.payload == b"Ticket data"
-
-
-def test_empty_payload():
-    """Test parsing RT response with empty payload."""
-    response = create_mock_response(b"RT/4.4.3 200 Ok\n\n")
-
-    result = parse_rt_response(response)
-
-    assert result.version == "4.4.3"
-    assert result.status_code == 200
-    assert result.status_text == "Ok"
-    assert result.is_ok is True
-    assert result.payload == b""
-
-
-def test_multiline_payload():
-    """Test parsing RT response with multiline payload."""
-    response = create_mock_response(b"RT/4.4.3 200 Ok\n\nLine 1\nLine 2\nLine 3")
+        CONTENT_URL,
+        ("4.4.3", 200, "Ok", True, b"Attachment content"),
+        id="content_url_trailing_suffix",
+    ),
+    param(
+        b"RT/4.4.3 200 Ok\n\nAttachment content\n\n\n",
+        CONTENT_URL + "/",
+        ("4.4.3", 200, "Ok", True, b"Attachment content"),
+        id="content_url_trailing_slash",
+    ),
+    # Only "Ok" makes is_ok True
+    param(
+        b"RT/4.4.3 200 Success\n\nTicket data",
+        TICKET_URL,
+        ("4.4.3", 200, "Success", False, b"Ticket data"),
+        id="200_different_status_text",
+    ),
+    param(
+        b"RT/4.4.3 200 Ok\n\n",
+        TICKET_URL,
+        ("4.4.3", 200, "Ok", True, b""),
+        id="empty_payload",
+    ),
+    param(
+        b"RT/4.4.3 200 Ok\n\nLine 1\nLine 2\nLine 3",
+        TICKET_URL,
+        ("4.4.3", 200, "Ok", True, b"Line 1\nLine 2\nLine 3"),
+        id="multiline_payload",
+    ),
+]
+
+MALFORMED_CASES = [
+    param(b"", "Empty response content", id="empty_content"),
+    param(
+        b"<html><body>Not an RT response</body></html>",
+        "Invalid RT response format",
+        id="not_rt_response",
+    ),
+    param(b"RT/ 200 Ok\n\nData", "Invalid RT response format", id="missing_version"),
+    param(
+        b"RT/4.4.3 Ok\n\nData", "Invalid RT response format", id="missing_status_code"
+    ),
+    param(
+        b"RT/4.4.3 200 Ok\nData",
+        "Invalid RT response format",
+        id="missing_double_newline",
+    ),
+]
+
+
+@mark.parametrize("content,url,expected", VALID_CASES)
+def test_valid_response(content, url, expected):
+    """Test parsing valid RT responses into RTResponseData."""
+    response = create_mock_response(content, url)
 
     result = parse_rt_response(response)
 
-    assert result.payload == b"Line 1\nLine 2\nLine 3"
-
-
-def test_empty_response_content():
-    """Test that empty response content raises RTResponseError."""
-    response = create_mock_response(b"")
-
-    with raises(RTResponseError, match="Empty response content"):
-        parse_rt_response(response)
-
-
-def test_invalid_response_format():
-    """Test that invalid response format raises RTResponseError."""
-    response = create_mock_response(b"<html><body>Not an RT response</body></html>")
-
-    with raises(RTResponseError, match="Invalid RT response format"):
-        parse_rt_response(response)
-
-
-def test_malformed_rt_header_missing_version():
-    """Test malformed RT header missing version number."""
-    response = create_mock_response(b"RT/ 200 Ok\n\nData")
-
-    with raises(RTResponseError, match="Invalid RT response format"):
-        parse_rt_response(response)
-
-
-def test_malformed_rt_header_missing_status_code():
-    """Test malformed RT header missing status code."""
-    response = create_mock_response(b"RT/4.4.3 Ok\n\nData")
-
-    with raises(RTResponseError, match="Invalid RT response format"):
-        parse_rt_response(response)
+    assert isinstance(result, RTResponseData)
+    version, status_code, status_text, is_ok, payload = expected
+    assert result.version == version
+    assert result.status_code == status_code
+    assert result.status_text == status_text
+    assert result.is_ok is is_ok
+    assert result.payload == payload
 
 
-def test_malformed_rt_header_missing_double_newline():
-    """Test malformed RT header missing double newline separator."""
-    response = create_mock_response(b"RT/4.4.3 200 Ok\nData")
+@mark.parametrize("content,message", MALFORMED_CASES)
+def test_malformed_response(content, message):
+    """Test that empty or malformed responses raise RTResponseError."""
+    response = create_mock_response(content)
 
-    with raises(RTResponseError, match="Invalid RT response format"):
+    with raises(RTResponseError, match=message):
         parse_rt_response(response)
 
 
@@ -186,7 +140,7 @@ def test_content_url_missing_suffix_logs_error(caplog):
     """Test that /content URL missing suffix logs an error but still works."""
     response = create_mock_response(
         b"RT/4.4.3 200 Ok\n\nAttachment without suffix",
-        "https://rt.example.com/REST/1.0/ticket/123/attachments/456/content",
+        CONTENT_URL,
     )
 
     result = parse_rt_response(response)
@@ -195,18 +149,6 @@ def test_content_url_missing_suffix_logs_error(caplog):
     assert "Abnormal end of content payload" in caplog.text
 
 
-def test_content_url_with_trailing_slash():
-    """Test that /content/ URL with trailing slash works."""
-    response = create_mock_response(
-        b"RT/4.4.3 200 Ok\n\nAttachment content\n\n\n",
-        "https://rt.example.com/REST/1.0/ticket/123/attachments/456/content/",
-    )
-
-    result = parse_rt_response(response)
-
-    assert result.payload == b"Attachment content"
-
-
 def test_response_error_includes_response_object():
     """Test that RTResponseError includes the original response object."""
     response = create_mock_response(b"Invalid content")
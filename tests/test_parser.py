@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from pytest import fixture
 
 from rt_tools.parser import (
@@ -11,6 +13,8 @@ from rt_tools.parser import (
     strip_quoted_reply,
 )
 
+from .conftest import load_fixture_bytes
+
 EXPECTED_CONTENT = """Hi All,
 
 We would like to request data submission through MFTS to Person Three's
@@ -34,22 +38,37 @@ Person One
 """
 
 
+def _read_fixture(path: Path) -> str:
+    return load_fixture_bytes(path).decode("utf-8")
+
+
+@fixture(scope="session")
+def rt37525_dir(fixtures_dir) -> Path:
+    return fixtures_dir / "rt37525_sanitized"
+
+
 @fixture(scope="module")
-def sample_attachment_list_data(fixtures_dir) -> str:
-    attachment_list_path = fixtures_dir / "rt37525_sanitized" / "attachments.txt"
-    attachment_list_data = attachment_list_path.read_text()
-    return attachment_list_data
+def sample_attachment_list_data(rt37525_dir) -> str:
+    return _read_fixture(rt37525_dir / "attachments.txt")
+
+
+@fixture(scope="session")
+def sample_history_list_data(rt37525_dir) -> str:
+    return _read_fixture(rt37525_dir / "history.txt")
+
+
+@fixture(scope="session")
+def parsed_sanitized_history(sample_history_list_data) -> list[HistoryItemMeta]:
+    return list(parse_history_list(sample_history_list_data))
 
 
 @fixture(scope="module")
-def sample_history_list_data(fixtures_dir) -> str:
-    history_list_path = fixtures_dir / "rt37525_sanitized" / "history.txt"
-    history_list_data = history_list_path.read_text()
-    return history_list_data
+def parsed_attachment_index(sample_attachment_list_data) -> dict[str, AttachmentMeta]:
+    return parse_attachment_list(sample_attachment_list_data)
 
 
-def test_parse_attachment_list_basic(sample_attachment_list_data):
-    attachment_index = parse_attachment_list(sample_attachment_list_data)
+def test_parse_attachment_list_basic(parsed_attachment_index):
+    attachment_index = parsed_attachment_index
     assert len(attachment_index) == 37
     assert attachment_index["1483996"] == AttachmentMeta(
         "(Unnamed)",
@@ -63,8 +82,8 @@ def test_parse_attachment_list_basic(sample_attachment_list_data):
     )
 
 
-def test_parse_history_list_basic(sample_history_list_data):
-    history_items = list(parse_history_list(sample_history_list_data))
+def test_parse_history_list_basic(parsed_sanitized_history):
+    history_items = parsed_sanitized_history
 
     # Should filter out outgoing emails and only return non-outgoing items
     assert len(history_items) > 0
@@ -114,14 +133,17 @@ def test_parse_history_list_filtering():
 
 
 @fixture(scope="module")
-def sample_history_data(fixtures_dir) -> str:
-    hist_item_path = fixtures_dir / "rt37525_sanitized" / "1489286" / "message.txt"
-    hist_item_data = hist_item_path.read_text()
-    return hist_item_data
+def sample_history_data(rt37525_dir) -> str:
+    return _read_fixture(rt37525_dir / "1489286" / "message.txt")
+
+
+@fixture(scope="module")
+def parsed_history_message(sample_history_data) -> HistoryMessage:
+    return parse_history_message(sample_history_data)
 
 
-def test_parse_message_basic(sample_history_data):
-    msg = parse_history_message(sample_history_data)
+def test_parse_message_basic(parsed_history_message):
+    msg = parsed_history_message
 
     assert isinstance(msg, HistoryMessage)
     assert msg.id == "1489286"
@@ -139,13 +161,13 @@ def test_parse_message_basic(sample_history_data):
     assert len(msg.attachments) == 3
 
 
-def test_parse_message_content(sample_history_data):
-    msg = parse_history_message(sample_history_data)
+def test_parse_message_content(parsed_history_message):
+    msg = parsed_history_message
     assert msg.content == EXPECTED_CONTENT
 
 
-def test_parse_message_attachments(sample_history_data):
-    msg = parse_history_message(sample_history_data)
+def test_parse_message_attachments(parsed_history_message):
+    msg = parsed_history_message
     assert msg.attachments[0] == Attachment(id="1483995", name="untitled", size="0b")
     assert msg.attachments[2].name == "Example Workbook.xlsx"
 
@@ -200,8 +222,8 @@ def test_strip_quoted_reply_outlook_style():
     )
 
 
-def test_strip_quoted_reply_fixture_1490011(fixtures_dir):
-    text = (fixtures_dir / "rt37525_sanitized" / "1490011" / "message.txt").read_text()
+def test_strip_quoted_reply_fixture_1490011(rt37525_dir):
+    text = _read_fixture(rt37525_dir / "1490011" / "message.txt")
     msg = parse_history_message(text)
     stripped = strip_quoted_reply(msg.content)
     assert "On Fri Aug 01 16:02:30 2025, user001 wrote:" not in stripped
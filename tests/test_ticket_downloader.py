@@ -1,109 +1,134 @@
 """Tests for RT ticket download automation."""
 
-import tempfile
+import os
+import re
+from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
-from unittest.mock import Mock
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock, patch
 
-from pytest import fixture
+from pytest import fixture, importorskip, mark, param, raises
 
-from rt_tools import RTSession, download_ticket
+from rt_tools import RTSession, download_ticket, parse_rt_response
 from rt_tools.downloader import TicketDownloader
 
+from .conftest import FIXTURE_DATA_PATH, load_fixture_bytes
 
-@fixture
-def mock_rt_responses(fixture_data_path):
-    """Create mock RT responses using fixture data."""
-    responses = {}
+_REST_URL = "https://rt.example.com/REST/1.0/"
 
-    # Load all fixture files
-    for fixture_file in fixture_data_path.glob("*.bin"):
-        with open(fixture_file, "rb") as f:
-            content = f.read()
-
-        # Map fixture files to RT endpoints
-        filename = fixture_file.stem
-        if filename == "metadata":
-            responses["ticket/123"] = content
-        elif filename == "history":
-            responses["ticket/123/history"] = content
-        elif filename == "attachments":
-            responses["ticket/123/attachments"] = content
-        elif filename.startswith("attachment_") and not filename.endswith("_content"):
-            attachment_id = filename.split("_")[1]
-            responses[f"ticket/123/attachments/{attachment_id}"] = content
-        elif filename.endswith("_content"):
-            attachment_id = filename.split("_")[1]
-            responses[f"ticket/123/attachments/{attachment_id}/content"] = content
-        elif filename.startswith("history_"):
-            history_id = filename.split("_")[1]
-            responses[f"ticket/123/history/id/{history_id}"] = content
-
-    return responses
 
+@dataclass(frozen=True, slots=True)
+class _FakeResponse:
+    """The subset of a requests Response that parse_rt_response reads."""
 
-@fixture
-def mock_session(mock_rt_responses):
-    """Create mock RTSession with fixture responses."""
-    session = Mock(spec=RTSession)
+    content: bytes
+    url: str
+    status_code: int
 
-    def mock_get(url):
-        """Mock GET requests to return fixture data."""
-        response = Mock()
-
-        # Extract endpoint from URL
-        if "/REST/1.0/" in url:
-            endpoint = url.split("/REST/1.0/")[1]
-            # Handle query parameters by checking if base endpoint exists
-            if endpoint in mock_rt_responses:
-                response.content = mock_rt_responses[endpoint]
-                response.url = url
-                response.status_code = 200
-            elif "?" in endpoint:
-                # Try without query parameters
-                base_endpoint = endpoint.split("?")[0]
-                if base_endpoint in mock_rt_responses:
-                    response.content = mock_rt_responses[base_endpoint]
-                    response.url = url
-                    response.status_code = 200
-                else:
-                    response.content = b"RT/4.4.3 404 Not Found\n\nEndpoint not found"
-                    response.url = url
-                    response.status_code = 404
-            else:
-                response.content = b"RT/4.4.3 404 Not Found\n\nEndpoint not found"
-                response.url = url
-                response.status_code = 404
-        else:
-            response.content = b"RT/4.4.3 404 Not Found\n\nInvalid URL"
-            response.url = url
-            response.status_code = 404
 
+# Fixture file stems that map directly to a ticket-level RT endpoint
+_FILENAME_TO_ENDPOINT = {
+    "metadata": "ticket/123",
+    "history": "ticket/123/history",
+    "attachments": "ticket/123/attachments",
+}
+_ATTACHMENT_RE = re.compile(r"attachment_(\d+)(_content)?")
+_HISTORY_RE = re.compile(r"history_(\d+)")
+
+
+def _fixture_endpoint(filename: str) -> str | None:
+    """Map a fixture file stem to the RT endpoint it was captured from."""
+    endpoint = _FILENAME_TO_ENDPOINT.get(filename)
+    if endpoint:
+        return endpoint
+    if match := _ATTACHMENT_RE.fullmatch(filename):
+        attachment_id, content = match.groups()
+        endpoint = f"ticket/123/attachments/{attachment_id}"
+        return f"{endpoint}/content" if content else endpoint
+    if match := _HISTORY_RE.fullmatch(filename):
+        return f"ticket/123/history/id/{match[1]}"
+    return None
+
+
+@cache
+def _build_rt_responses() -> MappingProxyType:
+    """Load the fixture files into a read-only endpoint-to-bytes mapping."""
+    responses = {}
+    with os.scandir(FIXTURE_DATA_PATH) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".bin"):
+                continue
+            endpoint = _fixture_endpoint(entry.name.removesuffix(".bin"))
+            if endpoint:
+                responses[endpoint] = load_fixture_bytes(Path(entry.path))
+    return MappingProxyType(responses)
+
+
+@fixture(scope="session")
+def mock_rt_responses():
+    """Create read-only mock RT responses using fixture data."""
+    return _build_rt_responses()
+
+
+class _StubSession:
+    """Stand-in for RTSession that serves prebuilt fixture responses."""
+
+    def __init__(self, url_map):
+        self._url_map = url_map
+        # Parse each known response once; fetch_rest hands out the shared
+        # RTResponseData, which the downloader only reads
+        self._parsed = {
+            url: parse_rt_response(response) for url, response in url_map.items()
+        }
+
+    def get(self, url):
+        """Mock GET requests to return fixture data."""
+        response = self._url_map.get(url)
+        if response is None:
+            response = _FakeResponse(
+                content=b"RT/4.4.3 404 Not Found\n\nEndpoint not found",
+                url=url,
+                status_code=404,
+            )
         return response
 
-    def mock_rest_url(*parts):
+    def rest_url(self, *parts):
         """Mock rest_url method."""
-        return "https://rt.example.com/REST/1.0/" + "/".join(parts)
+        return _REST_URL + "/".join(parts)
 
-    def mock_fetch_rest(*parts):
-        """Mock fetch_rest method to work with new *parts syntax."""
-        from rt_tools.session import parse_rt_response
+    def fetch_rest(self, *parts):
+        """Fetch and parse a REST endpoint as RTSession.fetch_rest does."""
+        url = self.rest_url(*parts)
+        parsed = self._parsed.get(url)
+        if parsed is None:
+            parsed = parse_rt_response(self.get(url))
+        return parsed
 
-        # Construct URL using the same logic as mock_rest_url
-        url = "https://rt.example.com/REST/1.0/" + "/".join(parts)
 
-        # Get response using existing mock_get logic
-        response = mock_get(url)
+@fixture(scope="session")
+def mock_session(mock_rt_responses):
+    """Create mock RTSession with fixture responses."""
+
+    # Pre-build the complete response for every known URL. RT ignores
+    # format=l on history requests, so that URL serves the basic history.
+    endpoints = dict(mock_rt_responses)
+    endpoints["ticket/123/history?format=l"] = endpoints["ticket/123/history"]
+    url_map = {}
+    for endpoint, content in endpoints.items():
+        url = _REST_URL + endpoint
+        url_map[url] = _FakeResponse(content=content, url=url, status_code=200)
+    return _StubSession(url_map)
 
-        # Parse the response as fetch_rest would do
-        return parse_rt_response(response)
 
-    session.get.side_effect = mock_get
-    session.rest_url.side_effect = mock_rest_url
-    session.fetch_rest.side_effect = mock_fetch_rest
-    return session
+@fixture(scope="session")
+def null_downloader():
+    """Create a TicketDownloader without a session for stateless helpers."""
+    return TicketDownloader(None)
 
 
-def test_fixture_data_exists(fixture_data_path):
+@mark.fixtures_integrity
+def test_fixture_data_exists():
     """Test that all required fixture files exist."""
     required_files = [
         "metadata.bin",
@@ -124,15 +149,17 @@ def test_fixture_data_exists(fixture_data_path):
         "attachment_801_content.bin",
     ]
 
+    with os.scandir(FIXTURE_DATA_PATH) as entries:
+        sizes = {entry.name: entry.stat().st_size for entry in entries}
+
     for filename in required_files:
-        filepath = fixture_data_path / filename
-        assert filepath.exists(), f"Missing fixture file: {filename}"
-        assert filepath.stat().st_size > 0, f"Empty fixture file: {filename}"
+        assert filename in sizes, f"Missing fixture file: {filename}"
+        assert sizes[filename] > 0, f"Empty fixture file: {filename}"
 
 
-def test_mock_rt_responses_structure(mock_rt_responses):
-    """Test that mock responses are properly structured."""
-    expected_endpoints = [
+@mark.parametrize(
+    "endpoint",
+    [
         "ticket/123",
         "ticket/123/history",
         "ticket/123/history/id/456",
@@ -149,453 +176,349 @@ def test_mock_rt_responses_structure(mock_rt_responses):
         "ticket/123/attachments/800/content",
         "ticket/123/attachments/801",
         "ticket/123/attachments/801/content",
-    ]
-
-    for endpoint in expected_endpoints:
-        assert endpoint in mock_rt_responses, f"Missing mock response for: {endpoint}"
-        assert mock_rt_responses[endpoint].startswith(b"RT/"), (
-            f"Invalid RT response format for: {endpoint}"
-        )
-
-
-def test_mock_session_get_requests(mock_session):
-    """Test that mock session returns correct responses."""
-    # Test ticket metadata
-    response = mock_session.get("https://rt.example.com/REST/1.0/ticket/123")
-    assert response.status_code == 200
-    assert b"id: ticket/123" in response.content
-
-    # Test ticket history
-    response = mock_session.get("https://rt.example.com/REST/1.0/ticket/123/history")
-    assert response.status_code == 200
-    assert b"# 3/3" in response.content
-    assert b"456: Ticket created by" in response.content
-
-    # Test ticket history with long format (now returns same as basic)
-    response = mock_session.get(
-        "https://rt.example.com/REST/1.0/ticket/123/history?format=l"
+    ],
+)
+def test_mock_rt_response_present(mock_rt_responses, endpoint):
+    """Test that each expected endpoint has a well-formed mock response."""
+    assert endpoint in mock_rt_responses, f"Missing mock response for: {endpoint}"
+    assert mock_rt_responses[endpoint].startswith(b"RT/"), (
+        f"Invalid RT response format for: {endpoint}"
     )
-    assert response.status_code == 200
-    assert b"# 3/3" in response.content
 
-    # Test attachments list
-    response = mock_session.get(
-        "https://rt.example.com/REST/1.0/ticket/123/attachments"
-    )
-    assert response.status_code == 200
-    assert b"456: (Unnamed)" in response.content
 
-    # Test attachment content
-    response = mock_session.get(
-        "https://rt.example.com/REST/1.0/ticket/123/attachments/789/content"
-    )
+@mark.parametrize(
+    "endpoint,expected",
+    [
+        # Ticket metadata
+        ("ticket/123", [b"id: ticket/123"]),
+        # Ticket history
+        ("ticket/123/history", [b"# 3/3", b"456: Ticket created by"]),
+        # Ticket history with long format (now returns same as basic)
+        ("ticket/123/history?format=l", [b"# 3/3"]),
+        # Attachments list
+        ("ticket/123/attachments", [b"456: (Unnamed)"]),
+        # Attachment content
+        ("ticket/123/attachments/789/content", [b"%PDF-1.4"]),
+    ],
+)
+def test_mock_session_get_requests(mock_session, endpoint, expected):
+    """Test that mock session returns correct responses."""
+    response = mock_session.get(_REST_URL + endpoint)
     assert response.status_code == 200
-    assert b"%PDF-1.4" in response.content
-
-
-def test_xlsx_to_tsv_conversion(rt37525_xlsx_fixtures):
-    """Test XLSX to TSV conversion functionality using real fixture file."""
-    from rt_tools.downloader import TicketDownloader
-
-    xlsx_path = rt37525_xlsx_fixtures["xlsx"]
-    tsv_fixture_path = rt37525_xlsx_fixtures["tsv"]
-
-    if not xlsx_path.exists():
-        # Skip test if fixture doesn't exist
-        import pytest
+    for snippet in expected:
+        assert snippet in response.content
 
-        pytest.skip(f"XLSX fixture not found: {xlsx_path}")
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        tsv_path = temp_path / "test_output.tsv"
+@fixture(scope="session")
+def tiny_xlsx(tmp_path_factory):
+    """Create a minimal two-row XLSX workbook once per session."""
+    openpyxl = importorskip("openpyxl")
+    xlsx_path = tmp_path_factory.mktemp("xlsx") / "tiny.xlsx"
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.active
+    worksheet.append(["Sample ID", "Path"])
+    worksheet.append(["A", "/tmp/a"])
+    workbook.save(xlsx_path)
+    return xlsx_path
 
-        # Create downloader and test conversion
-        downloader = TicketDownloader(None)
-        downloader._convert_xlsx_to_tsv(xlsx_path, tsv_path)
 
-        if tsv_path.exists():
-            # Verify TSV file was created and has content
-            tsv_content = tsv_path.read_text()
-            lines = tsv_content.strip().split("\n")
+@fixture(scope="session")
+def tiny_tsv_text(null_downloader, tiny_xlsx, tmp_path_factory):
+    """Convert the tiny workbook to TSV once per session and return the text."""
+    tsv_path = tmp_path_factory.mktemp("tsv") / "tiny.tsv"
+    null_downloader._convert_xlsx_to_tsv(tiny_xlsx, tsv_path)
+    return tsv_path.read_text()
 
-            # Should have at least header and some data
-            assert len(lines) >= 2, "TSV should have header and data rows"
 
-            # Check header (should be tab-separated)
-            header = lines[0]
-            assert "\t" in header, "Header should be tab-separated"
+def test_xlsx_to_tsv_conversion(tiny_tsv_text):
+    """Test XLSX to TSV conversion functionality using a generated workbook."""
+    # Header and data rows should be tab-separated
+    assert tiny_tsv_text == "Sample ID\tPath\nA\t/tmp/a\n"
 
-            # Check data rows are tab-separated
-            for i, line in enumerate(lines[1:], 2):
-                if line.strip():  # Skip empty lines
-                    assert "\t" in line, f"Line {i} should be tab-separated: {line}"
 
-            # Compare with fixture TSV for structure validation
-            if tsv_fixture_path.exists():
-                fixture_content = tsv_fixture_path.read_text().strip()
-                fixture_lines = fixture_content.split("\n")
+@fixture(scope="session")
+def rt37525_converted_tsv(null_downloader, rt37525_xlsx_fixtures, tmp_path_factory):
+    """Convert the RT 37525 workbook once per session and return the TSV text."""
+    importorskip("openpyxl")
+    tsv_path = tmp_path_factory.mktemp("rt37525") / "n1483997.tsv"
+    null_downloader._convert_xlsx_to_tsv(rt37525_xlsx_fixtures["xlsx"], tsv_path)
+    return tsv_path.read_text()
 
-                # Both should have similar structure
-                assert len(lines) > 0, "Generated TSV should have content"
-                assert len(fixture_lines) > 0, "Fixture TSV should have content"
-        else:
-            # If conversion failed, check if openpyxl is available
-            try:
-                import openpyxl  # noqa: F401
 
-                # If openpyxl is available but conversion failed, that's an error
-                raise AssertionError(
-                    "XLSX conversion failed despite openpyxl being available"
-                )
-            except ImportError:
-                # If openpyxl is not available, skip the test
-                import pytest
+def test_xlsx_to_tsv_conversion_matches_fixture(
+    rt37525_converted_tsv, rt37525_xlsx_fixtures
+):
+    """Test that converting the RT 37525 workbook reproduces its stored TSV."""
+    assert rt37525_converted_tsv == rt37525_xlsx_fixtures["tsv"].read_text()
 
-                pytest.skip("XLSX conversion skipped - openpyxl not available")
 
-
-def test_xlsx_to_tsv_conversion_with_invalid_file():
+def test_xlsx_to_tsv_conversion_with_invalid_file(null_downloader, tmp_path):
     """Test XLSX conversion with invalid file handles errors gracefully."""
-    from rt_tools.downloader import TicketDownloader
-
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        invalid_xlsx = temp_path / "invalid.xlsx"
-        tsv_path = temp_path / "output.tsv"
+    invalid_xlsx = tmp_path / "invalid.xlsx"
+    tsv_path = tmp_path / "output.tsv"
 
-        # Create an invalid XLSX file
-        invalid_xlsx.write_text("This is not a valid XLSX file")
+    # Create an invalid XLSX file
+    invalid_xlsx.write_text("This is not a valid XLSX file")
 
-        # Create downloader and attempt conversion
-        downloader = TicketDownloader(None)
-        downloader._convert_xlsx_to_tsv(invalid_xlsx, tsv_path)
+    # Attempt conversion
+    null_downloader._convert_xlsx_to_tsv(invalid_xlsx, tsv_path)
 
-        # TSV file should not be created due to error
-        assert not tsv_path.exists(), "TSV file should not be created for invalid XLSX"
+    # TSV file should not be created due to error
+    assert not tsv_path.exists(), "TSV file should not be created for invalid XLSX"
 
 
-def test_xlsx_conversion_trigger():
+def test_xlsx_conversion_trigger(null_downloader, tmp_path, monkeypatch):
     """Test that XLSX conversion method is called when XLSX extension is detected."""
-    from unittest.mock import patch
-
-    from rt_tools.downloader import TicketDownloader
-
     # Create a simple unit test that verifies the conversion is triggered
-    with tempfile.TemporaryDirectory() as temp_dir:
-        attachments_dir = Path(temp_dir) / "attachments"
-        attachments_dir.mkdir(exist_ok=True)
-
-        # Create a mock downloader and patch the conversion method
-        downloader = TicketDownloader(None)
-
-        with patch.object(downloader, "_convert_xlsx_to_tsv") as mock_convert:
-            # Manually call the part that should trigger conversion
-            # We'll simulate the file save and extension detection
-
-            history_id = "458"
-            attachment_id = "801"
-            extension = "xlsx"
-
-            # Create history directory and XLSX file with new structure
-            history_dir = attachments_dir / history_id
-            history_dir.mkdir(exist_ok=True)
-            xlsx_filename = f"n{attachment_id}.{extension}"
-            xlsx_file = history_dir / xlsx_filename
-
-            # Create a dummy XLSX file
-            xlsx_file.write_bytes(b"mock xlsx content")
-
-            # Test the conversion trigger logic
-            if extension == "xlsx":
-                tsv_filename = f"n{attachment_id}.tsv"
-                tsv_file = history_dir / tsv_filename
-                downloader._convert_xlsx_to_tsv(xlsx_file, tsv_file)
-
-            # Verify that the conversion method was called
-            mock_convert.assert_called_once_with(xlsx_file, history_dir / "n801.tsv")
+    attachments_dir = tmp_path / "attachments"
+    attachments_dir.mkdir(exist_ok=True)
 
+    # Record conversion calls on the shared downloader; monkeypatch restores it
+    calls = []
+    monkeypatch.setattr(
+        null_downloader, "_convert_xlsx_to_tsv", lambda *args: calls.append(args)
+    )
 
-def test_normalize_xlsx_value():
+    # Manually call the part that should trigger conversion
+    # We'll simulate the file save and extension detection
+
+    history_id = "458"
+    attachment_id = "801"
+    extension = "xlsx"
+
+    # Create history directory and XLSX file with new structure
+    history_dir = attachments_dir / history_id
+    history_dir.mkdir(exist_ok=True)
+    xlsx_filename = f"n{attachment_id}.{extension}"
+    xlsx_file = history_dir / xlsx_filename
+
+    # Create a dummy XLSX file
+    xlsx_file.write_bytes(b"mock xlsx content")
+
+    # Test the conversion trigger logic
+    if extension == "xlsx":
+        tsv_filename = f"n{attachment_id}.tsv"
+        tsv_file = history_dir / tsv_filename
+        null_downloader._convert_xlsx_to_tsv(xlsx_file, tsv_file)
+
+    # Verify that the conversion method was called
+    assert calls == [(xlsx_file, history_dir / "n801.tsv")]
+
+
+@mark.parametrize(
+    "value,expected",
+    [
+        (None, ""),
+        ("test string", "test string"),
+        (42, "42"),
+        (3.14, "3.14"),
+        # Falsy values other than None are kept
+        (0, "0"),
+        ("", ""),
+        (False, "False"),
+    ],
+)
+def test_normalize_xlsx_value(null_downloader, value, expected):
     """Test cell value normalization for XLSX conversion."""
-    from unittest.mock import Mock
-
-    from rt_tools.downloader import TicketDownloader
-
-    downloader = TicketDownloader(None)
-
-    # Test None value
-    none_cell = Mock()
-    none_cell.value = None
-    assert downloader._normalize_xlsx_value(none_cell) == ""
-
-    # Test string value
-    str_cell = Mock()
-    str_cell.value = "test string"
-    assert downloader._normalize_xlsx_value(str_cell) == "test string"
-
-    # Test numeric value
-    num_cell = Mock()
-    num_cell.value = 42
-    assert downloader._normalize_xlsx_value(num_cell) == "42"
-
-    # Test float value
-    float_cell = Mock()
-    float_cell.value = 3.14
-    assert downloader._normalize_xlsx_value(float_cell) == "3.14"
-
-
-def test_mime_type_to_extension():
+    cell = SimpleNamespace(value=value)
+    assert null_downloader._normalize_xlsx_value(cell) == expected
+
+
+@mark.parametrize(
+    "mime_type,extension",
+    [
+        # Common MIME types
+        ("text/plain", "txt"),
+        ("text/html", "html"),
+        ("application/pdf", "pdf"),
+        ("image/png", "png"),
+        ("image/jpeg", "jpg"),
+        # Microsoft Office formats
+        ("application/vnd.ms-excel", "xls"),
+        ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "xlsx"),
+        (
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            "docx",
+        ),
+        # Case insensitivity
+        ("TEXT/PLAIN", "txt"),
+        ("Application/PDF", "pdf"),
+        # Unknown MIME types default to "bin"
+        ("unknown/type", "bin"),
+        ("", "bin"),
+        ("invalid-mime", "bin"),
+    ],
+)
+def test_mime_type_to_extension(null_downloader, mime_type, extension):
     """Test MIME type to file extension conversion."""
-    downloader = TicketDownloader(None)
-
-    # Test common MIME types
-    assert downloader._mime_type_to_extension("text/plain") == "txt"
-    assert downloader._mime_type_to_extension("text/html") == "html"
-    assert downloader._mime_type_to_extension("application/pdf") == "pdf"
-    assert downloader._mime_type_to_extension("image/png") == "png"
-    assert downloader._mime_type_to_extension("image/jpeg") == "jpg"
-
-    # Test Microsoft Office formats
-    assert downloader._mime_type_to_extension("application/vnd.ms-excel") == "xls"
-    assert (
-        downloader._mime_type_to_extension(
-            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-        )
-        == "xlsx"
-    )
-    assert (
-        downloader._mime_type_to_extension(
-            "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-        )
-        == "docx"
-    )
-
-    # Test case insensitivity
-    assert downloader._mime_type_to_extension("TEXT/PLAIN") == "txt"
-    assert downloader._mime_type_to_extension("Application/PDF") == "pdf"
-
-    # Test unknown MIME types default to "bin"
-    assert downloader._mime_type_to_extension("unknown/type") == "bin"
-    assert downloader._mime_type_to_extension("") == "bin"
-    assert downloader._mime_type_to_extension("invalid-mime") == "bin"
+    assert null_downloader._mime_type_to_extension(mime_type) == extension
 
 
-def test_download_ticket_convenience_function(mock_session):
-    """Test the download_ticket convenience function."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        parent_dir = Path(temp_dir) / "test_output"
-
-        # Call the convenience function
-        download_ticket(mock_session, "123", parent_dir)
-
-        # Verify it creates the ticket directory structure
-        ticket_dir = parent_dir / "rt123"
-        assert ticket_dir.exists()
-        assert (ticket_dir / "metadata.txt").exists()
-        assert (ticket_dir / "history.txt").exists()
-        assert (ticket_dir / "attachments.txt").exists()
-
-        # Verify content.txt is created for history entries with non-empty content
-        assert (ticket_dir / "456" / "content.txt").exists()
-        assert (ticket_dir / "457" / "content.txt").exists()
-        assert (ticket_dir / "458" / "content.txt").exists()
-
+@fixture(scope="session")
+def downloaded_ticket_dir(mock_session, tmp_path_factory):
+    """Download mock ticket 123 once per session and return its directory."""
+    parent_dir = tmp_path_factory.mktemp("test_output")
 
-def test_download_metadata_success(mock_session):
-    """Test successful metadata download."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        target_dir = Path(temp_dir)
-        downloader = TicketDownloader(mock_session)
+    # Call the convenience function
+    download_ticket(mock_session, "123", parent_dir)
+    return parent_dir / "rt123"
 
-        downloader._download_metadata("123", target_dir)
 
-        metadata_file = target_dir / "metadata.txt"
-        assert metadata_file.exists()
-
-        content = metadata_file.read_text()
-        assert "id: ticket/123" in content
-
-
-def test_download_metadata_failure(mock_session):
-    """Test metadata download with API failure."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        target_dir = Path(temp_dir)
-        downloader = TicketDownloader(mock_session)
+def test_download_ticket_convenience_function(downloaded_ticket_dir):
+    """Test the download_ticket convenience function."""
+    # Collect every file written under the ticket directory in one walk
+    ticket_dir = downloaded_ticket_dir
+    assert ticket_dir.is_dir()
+    written = {
+        path.relative_to(ticket_dir).as_posix()
+        for path in ticket_dir.rglob("*")
+        if path.is_file()
+    }
+
+    # Ticket-level files, plus content.txt for history entries with content
+    expected = {
+        "metadata.txt",
+        "history.txt",
+        "attachments.txt",
+        "456/content.txt",
+        "457/content.txt",
+        "458/content.txt",
+    }
+    missing = expected - written
+    assert not missing, f"Missing downloaded files: {sorted(missing)}"
 
-        # Test with non-existent ticket
-        downloader._download_metadata("999", target_dir)
 
-        metadata_file = target_dir / "metadata.txt"
+@fixture
+def downloader(mock_session):
+    """Create a TicketDownloader backed by the mock session."""
+    return TicketDownloader(mock_session)
+
+
+@mark.parametrize(
+    "ticket_id,expected",
+    [
+        param("123", "id: ticket/123", id="success"),
+        # Non-existent ticket
+        param("999", None, id="failure"),
+    ],
+)
+def test_download_metadata(downloader, tmp_path, ticket_id, expected):
+    """Test metadata download for a known and an unknown ticket."""
+    downloader._download_metadata(ticket_id, tmp_path)
+
+    metadata_file = tmp_path / "metadata.txt"
+    if expected is None:
         assert not metadata_file.exists()
-
-
-def test_download_history_success(mock_session):
-    """Test successful history download."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        target_dir = Path(temp_dir)
-        downloader = TicketDownloader(mock_session)
-
-        payload = downloader._download_history("123", target_dir)
-
-        # Should return payload
-        assert payload is not None
-        assert isinstance(payload, bytes)
-
-        # Should create history file
-        history_file = target_dir / "history.txt"
-        assert history_file.exists()
-
-        content = history_file.read_text()
-        assert "# 3/3" in content
-
-
-def test_download_history_failure(mock_session):
-    """Test history download with API failure."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        target_dir = Path(temp_dir)
-        downloader = TicketDownloader(mock_session)
-
-        # Test with non-existent ticket
-        payload = downloader._download_history("999", target_dir)
-
-        # Should return None on failure
+    else:
+        assert metadata_file.read_text().startswith(expected)
+
+
+@mark.parametrize(
+    "ticket_id,expected",
+    [
+        param("123", "# 3/3", id="success"),
+        # Non-existent ticket
+        param("999", None, id="failure"),
+    ],
+)
+def test_download_history(downloader, tmp_path, ticket_id, expected):
+    """Test history download for a known and an unknown ticket."""
+    payload = downloader._download_history(ticket_id, tmp_path)
+
+    history_file = tmp_path / "history.txt"
+    if expected is None:
+        # Should return None and not create history file on failure
         assert payload is None
-
-        # Should not create history file
-        history_file = target_dir / "history.txt"
         assert not history_file.exists()
-
-
-def test_download_attachment_list_success(mock_session):
-    """Test successful attachment list download."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        target_dir = Path(temp_dir)
-        downloader = TicketDownloader(mock_session)
-
-        payload = downloader._download_attachment_ist("123", target_dir)
-
-        # Should return payload
-        assert payload is not None
+    else:
         assert isinstance(payload, bytes)
+        assert history_file.read_text().startswith(expected)
 
-        # Should create attachments file
-        attachments_file = target_dir / "attachments.txt"
-        assert attachments_file.exists()
 
-        content = attachments_file.read_text()
-        assert "456: (Unnamed)" in content
-
-
-def test_download_individual_history_item_success(mock_session):
-    """Test successful individual history item download."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        target_dir = Path(temp_dir)
-        downloader = TicketDownloader(mock_session)
-
-        payload = downloader._download_individual_history_item("123", target_dir, "456")
-
-        # Should return payload
-        assert payload is not None
-        assert isinstance(payload, bytes)
-
-        # Should create history directory and message file
-        history_dir = target_dir / "456"
-        message_file = history_dir / "message.txt"
-
-        assert history_dir.exists()
-        assert message_file.exists()
-
-        content = message_file.read_text()
-        assert "id: 456" in content
-
-
-def test_download_individual_history_item_failure(mock_session):
-    """Test individual history item download with API failure."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        target_dir = Path(temp_dir)
-        downloader = TicketDownloader(mock_session)
-
-        # Test with non-existent history item
-        payload = downloader._download_individual_history_item("123", target_dir, "999")
-
-        # Should return None on failure
+def test_download_attachment_list_success(downloader, tmp_path):
+    """Test successful attachment list download."""
+    payload = downloader._download_attachment_ist("123", tmp_path)
+
+    # Should return payload
+    assert payload is not None
+    assert isinstance(payload, bytes)
+
+    # Should create attachments file
+    attachments_file = tmp_path / "attachments.txt"
+    assert attachments_file.exists()
+
+    content = attachments_file.read_text()
+    assert content.startswith("456: (Unnamed)")
+
+
+@mark.parametrize(
+    "history_id,expected",
+    [
+        param("456", "id: 456", id="success"),
+        # Non-existent history item
+        param("999", None, id="failure"),
+    ],
+)
+def test_download_individual_history_item(downloader, tmp_path, history_id, expected):
+    """Test individual history item download for known and unknown items."""
+    payload = downloader._download_individual_history_item("123", tmp_path, history_id)
+
+    history_dir = tmp_path / history_id
+    if expected is None:
+        # Should return None and not create directory on failure
         assert payload is None
-
-        # Should not create directory
-        history_dir = target_dir / "999"
         assert not history_dir.exists()
+    else:
+        assert isinstance(payload, bytes)
+        assert expected in (history_dir / "message.txt").read_text()
+
+
+@mark.parametrize(
+    "attachment_id,expected",
+    [
+        param("800", b"%PDF-1.4", id="success"),
+        # Non-existent attachment
+        param("999", None, id="failure"),
+    ],
+)
+def test_download_history_attachment(downloader, tmp_path, attachment_id, expected):
+    """Test history attachment download for known and unknown attachments."""
+    # Create history directory first
+    history_dir = tmp_path / "458"
+    history_dir.mkdir(parents=True)
+
+    downloader._download_history_attachment(
+        "123", tmp_path, "458", attachment_id, "application/pdf"
+    )
 
-
-def test_download_history_attachment_success(mock_session):
-    """Test successful history attachment download."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        target_dir = Path(temp_dir)
-        downloader = TicketDownloader(mock_session)
-
-        # Create history directory first
-        history_dir = target_dir / "458"
-        history_dir.mkdir(parents=True)
-
-        downloader._download_history_attachment(
-            "123", target_dir, "458", "800", "application/pdf"
-        )
-
-        # Should create attachment file
-        attachment_file = history_dir / "n800.pdf"
-        assert attachment_file.exists()
-
-        content = attachment_file.read_bytes()
-        assert b"%PDF-1.4" in content
+    attachment_file = history_dir / f"n{attachment_id}.pdf"
+    if expected is None:
+        assert not attachment_file.exists()
+    else:
+        assert attachment_file.read_bytes().startswith(expected)
 
 
-def test_download_history_attachment_xlsx_conversion(mock_session):
+def test_download_history_attachment_xlsx_conversion(downloader, tmp_path):
     """Test XLSX attachment download with automatic TSV conversion."""
-    from unittest.mock import patch
-
-    with tempfile.TemporaryDirectory() as temp_dir:
-        target_dir = Path(temp_dir)
-        downloader = TicketDownloader(mock_session)
-
-        # Create history directory first
-        history_dir = target_dir / "458"
-        history_dir.mkdir(parents=True)
-
-        with patch.object(downloader, "_convert_xlsx_to_tsv") as mock_convert:
-            xlsx_mime_type = (
-                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            )
-            downloader._download_history_attachment(
-                "123", target_dir, "458", "801", xlsx_mime_type
-            )
-
-            # Should create XLSX file
-            xlsx_file = history_dir / "n801.xlsx"
-            assert xlsx_file.exists()
-
-            # Should trigger TSV conversion
-            tsv_file = history_dir / "n801.tsv"
-            mock_convert.assert_called_once_with(xlsx_file, tsv_file)
-
+    # Create history directory first
+    history_dir = tmp_path / "458"
+    history_dir.mkdir(parents=True)
 
-def test_download_history_attachment_failure(mock_session):
-    """Test history attachment download with API failure."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        target_dir = Path(temp_dir)
-        downloader = TicketDownloader(mock_session)
-
-        # Create history directory first
-        history_dir = target_dir / "458"
-        history_dir.mkdir(parents=True)
-
-        # Test with non-existent attachment
+    with patch.object(downloader, "_convert_xlsx_to_tsv") as mock_convert:
+        xlsx_mime_type = (
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        )
         downloader._download_history_attachment(
-            "123", target_dir, "458", "999", "application/pdf"
+            "123", tmp_path, "458", "801", xlsx_mime_type
         )
 
-        # Should not create attachment file
-        attachment_file = history_dir / "n999.pdf"
-        assert not attachment_file.exists()
+        # Should create XLSX file
+        xlsx_file = history_dir / "n801.xlsx"
+        assert xlsx_file.exists()
+
+        # Should trigger TSV conversion
+        tsv_file = history_dir / "n801.tsv"
+        mock_convert.assert_called_once_with(xlsx_file, tsv_file)
 
 
 def test_ticket_downloader_init():
@@ -606,129 +529,97 @@ def test_ticket_downloader_init():
     assert downloader.session is mock_session
 
 
-def test_convert_xlsx_to_tsv_no_openpyxl():
+def test_convert_xlsx_to_tsv_no_openpyxl(null_downloader, tmp_path):
     """Test XLSX conversion when openpyxl is not available."""
-    from unittest.mock import patch
-
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        xlsx_file = temp_path / "test.xlsx"
-        tsv_file = temp_path / "test.tsv"
+    xlsx_file = tmp_path / "test.xlsx"
+    tsv_file = tmp_path / "test.tsv"
 
-        # Create a dummy XLSX file
-        xlsx_file.write_bytes(b"dummy content")
+    # Create a dummy XLSX file
+    xlsx_file.write_bytes(b"dummy content")
 
-        # Mock openpyxl as None
-        with patch("rt_tools.downloader.openpyxl", None):
-            downloader = TicketDownloader(None)
-            downloader._convert_xlsx_to_tsv(xlsx_file, tsv_file)
+    # Mock openpyxl as None
+    with patch("rt_tools.downloader.openpyxl", None):
+        null_downloader._convert_xlsx_to_tsv(xlsx_file, tsv_file)
 
-            # Should not create TSV file
-            assert not tsv_file.exists()
+        # Should not create TSV file
+        assert not tsv_file.exists()
 
 
-def test_directory_creation():
-    """Test that target directories are created properly."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        parent_dir = temp_path / "deep" / "nested" / "directory"
-
-        mock_session = Mock(spec=RTSession)
-        # Mock failed responses that don't try to write files
-        mock_rt_data = Mock()
-        mock_rt_data.is_ok = False
-        mock_rt_data.status_code = 404
-        mock_rt_data.status_text = "Not Found"
-        mock_session.fetch_rest.return_value = mock_rt_data
+@fixture(scope="module")
+def failing_rt_session():
+    """Create one RTSession mock whose every request fails with 404."""
+    return Mock(spec=RTSession)
 
-        downloader = TicketDownloader(mock_session)
 
-        # This should create the directory even if downloads fail
-        downloader.download_ticket("123", parent_dir)
-
-        ticket_dir = parent_dir / "rt123"
-        assert ticket_dir.exists()
-        assert ticket_dir.is_dir()
+@fixture
+def failing_session(failing_rt_session):
+    """Reset the shared failing session and return it for a single test."""
+    failing_rt_session.reset_mock()
+    # Failed responses don't try to write files
+    failing_rt_session.fetch_rest.return_value = SimpleNamespace(
+        is_ok=False, status_code=404, status_text="Not Found"
+    )
+    return failing_rt_session
 
 
-def test_path_conversion():
-    """Test that string paths are converted to Path objects."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        parent_dir_str = str(Path(temp_dir) / "string_path")
+def test_directory_creation(failing_session, tmp_path):
+    """Test that target directories are created properly."""
+    parent_dir = tmp_path / "deep" / "nested" / "directory"
 
-        mock_session = Mock(spec=RTSession)
-        # Mock failed responses that don't try to write files
-        mock_rt_data = Mock()
-        mock_rt_data.is_ok = False
-        mock_rt_data.status_code = 404
-        mock_rt_data.status_text = "Not Found"
-        mock_session.fetch_rest.return_value = mock_rt_data
+    downloader = TicketDownloader(failing_session)
 
-        downloader = TicketDownloader(mock_session)
+    # This should create the directory even if downloads fail
+    downloader.download_ticket("123", parent_dir)
 
-        # Should accept string path and convert to Path
-        downloader.download_ticket("123", parent_dir_str)
+    ticket_dir = parent_dir / "rt123"
+    assert ticket_dir.exists()
+    assert ticket_dir.is_dir()
 
-        ticket_dir = Path(parent_dir_str) / "rt123"
-        assert ticket_dir.exists()
 
+def test_path_conversion(failing_session, tmp_path):
+    """Test that string paths are converted to Path objects."""
+    parent_dir_str = str(tmp_path / "string_path")
 
-def test_error_handling_in_main_download(mock_session):
-    """Test error handling in main download_ticket method."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        parent_dir = Path(temp_dir)
-        downloader = TicketDownloader(mock_session)
+    downloader = TicketDownloader(failing_session)
 
-        # Mock history download failure
-        def failing_download_history(*args, **kwargs):
-            return None  # Simulate failure
+    # Should accept string path and convert to Path
+    downloader.download_ticket("123", parent_dir_str)
 
-        downloader._download_history = failing_download_history
+    ticket_dir = Path(parent_dir_str) / "rt123"
+    assert ticket_dir.exists()
 
-        # Should handle failure gracefully and return early
-        downloader.download_ticket("123", parent_dir)
 
-        # Should still create metadata but not history items
-        ticket_dir = parent_dir / "rt123"
-        assert (ticket_dir / "metadata.txt").exists()
-        assert not any(ticket_dir.glob("*/message.txt"))  # No history items
+def test_error_handling_in_main_download(downloader, tmp_path):
+    """Test error handling in main download_ticket method."""
+    parent_dir = tmp_path
 
+    # Mock history download failure
+    def failing_download_history(*args, **kwargs):
+        return None  # Simulate failure
 
-def test_edge_cases():
-    """Test various edge cases and boundary conditions."""
-    downloader = TicketDownloader(None)
+    downloader._download_history = failing_download_history
 
-    # Test _normalize_xlsx_value with edge cases
-    edge_cell = Mock()
-    edge_cell.value = 0
-    assert downloader._normalize_xlsx_value(edge_cell) == "0"
+    # Should handle failure gracefully and return early
+    downloader.download_ticket("123", parent_dir)
 
-    edge_cell.value = ""
-    assert downloader._normalize_xlsx_value(edge_cell) == ""
+    # Should still create metadata but not history items
+    ticket_dir = parent_dir / "rt123"
+    assert (ticket_dir / "metadata.txt").exists()
+    assert not any(ticket_dir.glob("*/message.txt"))  # No history items
 
-    edge_cell.value = False
-    assert downloader._normalize_xlsx_value(edge_cell) == "False"
 
-    # Test _mime_type_to_extension with None (should not crash)
-    try:
-        result = downloader._mime_type_to_extension(None)
-        # If it doesn't crash, it should return "bin"
-        assert result == "bin"
-    except (AttributeError, TypeError):
-        # This is also acceptable behavior
-        pass
+def test_mime_type_to_extension_rejects_none(null_downloader):
+    """Test that _mime_type_to_extension expects a MIME type string."""
+    with raises(AttributeError):
+        null_downloader._mime_type_to_extension(None)
 
 
-def test_unicode_in_history_messages():
+def test_unicode_in_history_messages(tmp_path):
     """Test that Unicode characters in history messages are handled correctly.
 
     This test exposes the bug that occurred when history messages contained
     Unicode characters but the code tried to decode them as ASCII.
     """
-    import tempfile
-    from pathlib import Path
-    from unittest.mock import Mock, patch
-
     # Create mock history message content with Unicode characters
     # This simulates real RT content that might contain em dashes, smart quotes, etc.
     unicode_history_content = (
@@ -752,55 +643,50 @@ def test_unicode_in_history_messages():
     # Encode as UTF-8 bytes (what RT would actually return)
     unicode_history_bytes = unicode_history_content.encode("utf-8")
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        target_dir = Path(temp_dir)
-        ticket_dir = target_dir / "rt37597"
-        ticket_dir.mkdir()
+    target_dir = tmp_path
+    ticket_dir = target_dir / "rt37597"
+    ticket_dir.mkdir()
 
-        # Create mock session
-        mock_session = Mock(spec=RTSession)
+    # Create mock session
+    mock_session = Mock(spec=RTSession)
 
-        # Mock the individual history item download to return Unicode content
-        mock_rt_data = Mock()
-        mock_rt_data.is_ok = True
-        mock_rt_data.payload = unicode_history_bytes
-        mock_session.fetch_rest.return_value = mock_rt_data
+    # Mock the individual history item download to return Unicode content
+    mock_rt_data = SimpleNamespace(is_ok=True, payload=unicode_history_bytes)
+    mock_session.fetch_rest.return_value = mock_rt_data
 
-        downloader = TicketDownloader(mock_session)
+    downloader = TicketDownloader(mock_session)
 
-        # This should work with UTF-8 decoding (current implementation)
-        result = downloader._download_individual_history_item(
-            "37597", ticket_dir, "1493258"
-        )
-        assert result == unicode_history_bytes
-
-        # Verify the message was saved correctly
-        message_file = ticket_dir / "1493258" / "message.txt"
-        assert message_file.exists()
-        saved_content = message_file.read_bytes()
-        assert saved_content == unicode_history_bytes
-
-        # Now test what would happen with ASCII decoding (the bug)
-        # We'll temporarily patch the method to use ASCII decoding
-        with patch.object(
-            downloader, "_download_individual_history_item"
-        ) as mock_download:
-            mock_download.return_value = unicode_history_bytes
-
-            # This simulates the old buggy behavior
-            try:
-                # This is what the old code was trying to do:
-                history_item_text = unicode_history_bytes.decode("ascii")
-                # If we get here, the test environment doesn't have Unicode chars
-                # that would trigger the bug, so we force the error
-                raise AssertionError("Expected UnicodeDecodeError with ASCII decoding")
-            except UnicodeDecodeError as e:
-                # This is the bug we fixed - Unicode content can't be decoded as ASCII
-                assert "ascii" in str(e)
-                assert "can't decode byte" in str(e)
-
-                # But with UTF-8 decoding (the fix), it should work fine
-                history_item_text = unicode_history_bytes.decode("utf-8")
-                assert "em dashes" in history_item_text
-                assert "smart quotes" in history_item_text
-                assert "café" in history_item_text
+    # This should work with UTF-8 decoding (current implementation)
+    result = downloader._download_individual_history_item(
+        "37597", ticket_dir, "1493258"
+    )
+    assert result == unicode_history_bytes
+
+    # Verify the message was saved correctly
+    message_file = ticket_dir / "1493258" / "message.txt"
+    assert message_file.exists()
+    saved_content = message_file.read_bytes()
+    assert saved_content == unicode_history_bytes
+
+    # Now test what would happen with ASCII decoding (the bug)
+    # We'll temporarily patch the method to use ASCII decoding
+    with patch.object(downloader, "_download_individual_history_item") as mock_download:
+        mock_download.return_value = unicode_history_bytes
+
+        # This simulates the old buggy behavior
+        try:
+            # This is what the old code was trying to do:
+            history_item_text = unicode_history_bytes.decode("ascii")
+            # If we get here, the test environment doesn't have Unicode chars
+            # that would trigger the bug, so we force the error
+            raise AssertionError("Expected UnicodeDecodeError with ASCII decoding")
+        except UnicodeDecodeError as e:
+            # This is the bug we fixed - Unicode content can't be decoded as ASCII
+            assert "ascii" in str(e)
+            assert "can't decode byte" in str(e)
+
+            # But with UTF-8 decoding (the fix), it should work fine
+            history_item_text = unicode_history_bytes.decode("utf-8")
+            assert "em dashes" in history_item_text
+            assert "smart quotes" in history_item_text
+            assert "café" in history_item_text